@@ -1,4 +1,26 @@
 import csv
+import os
+import struct
+import sys
+from array import array
+from itertools import chain, islice
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; totals fall back to plain Python arithmetic
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional. This stand-in accepts the same call forms as numba.njit
+    # (@njit, @njit(...) and @njit("signature", ...)) and leaves functions unchanged.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # ENERGY SPENT TRACKER APPLICATION
 # --------------------------------
@@ -12,6 +34,13 @@ import csv
 # ===========================
 # HELPER FUNCTIONS FOR INPUT VALIDATION
 # ===========================
+
+# Validation messages, preformatted for direct writes in the retry loops
+_ERR_POS = "❌ Please enter a positive number.\n"
+_ERR_NUM = "❌ Invalid input. Please enter a valid number.\n"
+_ERR_INT = "❌ Invalid input. Please enter a number.\n"
+_ERR_SEL = "❌ Invalid selection. Please try again.\n"
+
 def get_positive_float(prompt):
     """
     Prompt the user until a valid positive float is entered.
@@ -25,12 +54,12 @@ def get_positive_float(prompt):
     while True:
         try:
             value = float(input(prompt))
-            if value > 0:
-                return value
-            else:
-                print("❌ Please enter a positive number.")
         except ValueError:
-            print("❌ Invalid input. Please enter a valid number.")
+            sys.stdout.write(_ERR_NUM)
+            continue
+        if value > 0:
+            return value
+        sys.stdout.write(_ERR_POS)
 
 
 def get_int(prompt, min_value=None, max_value=None):
@@ -45,15 +74,18 @@ def get_int(prompt, min_value=None, max_value=None):
     Returns:
     - int: A validated integer.
     """
+    # Missing bounds become infinities so the loop needs a single chained comparison
+    lo = float("-inf") if min_value is None else min_value
+    hi = float("inf") if max_value is None else max_value
     while True:
         try:
             value = int(input(prompt))
-            if (min_value is not None and value < min_value) or (max_value is not None and value > max_value):
-                print("❌ Invalid selection. Please try again.")
-            else:
-                return value
         except ValueError:
-            print("❌ Invalid input. Please enter a number.")
+            sys.stdout.write(_ERR_INT)
+            continue
+        if lo <= value <= hi:
+            return value
+        sys.stdout.write(_ERR_SEL)
 
 
 # ===========================
@@ -79,6 +111,198 @@ def add_appliance(name, watts, hours_per_day):
     }
     return appliance
 
+def _float_column(values):
+    """
+    Copy a sequence of numbers into a new array('d') column.
+
+    Parameters:
+    - values (sequence): The numbers to copy; NumPy arrays are copied in bulk.
+
+    Returns:
+    - array.array: A float64 column holding the values.
+    """
+    column = array("d")
+    if np is not None and isinstance(values, np.ndarray):
+        column.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    else:
+        column.extend(float(value) for value in values)
+    return column
+
+class AppliancesTable:
+    """
+    Column-oriented (structure-of-arrays) storage for the appliance list.
+
+    Names are kept in a list, while watts and hours per day live in two
+    array('d') columns of contiguous float64 values, so bulk calculations
+    read the numeric columns directly instead of walking a list of
+    dictionaries. When NumPy is available the watts and hours properties
+    expose the columns as zero-copy ndarray views.
+
+    Indexing and iterating return appliance dictionaries, so the table can
+    stand in wherever a list of appliances is only read. Changes must go
+    through append(), pop() and the set_* methods, which also invalidate
+    the cached monthly kWh column.
+    """
+
+    def __init__(self, appliances=()):
+        """
+        Parameters:
+        - appliances (iterable, optional): Appliance dictionaries to start with.
+        """
+        self.names = []
+        self._watts = array("d")
+        self._hours = array("d")
+        self._monthly_kwh = None  # Cached monthly kWh column, rebuilt lazily
+        for appliance in appliances:
+            self.append(appliance)
+
+    @classmethod
+    def from_columns(cls, names, watts, hours):
+        """
+        Build a table directly from its three columns instead of row by row.
+
+        Parameters:
+        - names (list): The appliance names.
+        - watts (sequence): The power consumption of each appliance, in watts.
+        - hours (sequence): The daily hours of use of each appliance.
+
+        Returns:
+        - AppliancesTable: A new table holding copies of the columns.
+        """
+        count = len(names)
+        if len(watts) != count or len(hours) != count:
+            raise ValueError("All columns must have the same length.")
+        table = cls()
+        table.names = list(names)
+        table._watts = _float_column(watts)
+        table._hours = _float_column(hours)
+        return table
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Build a table from (name, watts, hours_per_day) tuples without creating a dict per row.
+
+        Parameters:
+        - rows (iterable): The appliance rows.
+
+        Returns:
+        - AppliancesTable: A new table holding the rows.
+        """
+        table = cls()
+        append_name = table.names.append
+        append_watts = table._watts.append
+        append_hours = table._hours.append
+        for name, watts, hours_per_day in rows:
+            append_name(name)
+            append_watts(watts)
+            append_hours(hours_per_day)
+        return table
+
+    @property
+    def watts(self):
+        """
+        A copy of the power consumption column (in watts), one entry per appliance.
+        """
+        return array("d", self._watts)
+
+    @property
+    def hours(self):
+        """
+        A copy of the hours-per-day column, one entry per appliance.
+        """
+        return array("d", self._hours)
+
+    def _column_views(self):
+        """
+        Return zero-copy float64 ndarray views of the watts and hours columns.
+
+        Only for immediate use: an array('d') cannot be resized while a view
+        of it exists, so append() and pop() would raise BufferError.
+        """
+        return np.frombuffer(self._watts, dtype=np.float64), np.frombuffer(self._hours, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return add_appliance(self.names[index], self._watts[index], self._hours[index])
+
+    def __iter__(self):
+        for name, watts, hours in self.rows():
+            yield add_appliance(name, watts, hours)
+
+    def rows(self):
+        """
+        Return an iterator of (name, watts, hours_per_day) tuples, one per appliance.
+        """
+        return zip(self.names, self._watts, self._hours)
+
+    def monthly_kwh(self):
+        """
+        Return the monthly energy consumption (in kWh) of every appliance.
+
+        The column is computed on first use and reused until watts or hours
+        change, so repeated reports skip the multiplication. Treat the result
+        as read-only.
+
+        Returns:
+        - numpy.ndarray or list: The monthly kWh, one entry per appliance.
+        """
+        if self._monthly_kwh is None:
+            if np is not None:
+                # A fresh array, not a scratch buffer: the cache outlives the report
+                self._monthly_kwh = np.empty(len(self.names), dtype=np.float64)
+                watts, hours = self._column_views()
+                _compute_monthly_kwh(watts, hours, self._monthly_kwh)
+            else:
+                # Same operation order as calculate_daily_kwh/calculate_monthly_kwh, so results match bit for bit
+                self._monthly_kwh = [watts * hours / 1000.0 * 30.0 for watts, hours in zip(self._watts, self._hours)]
+        return self._monthly_kwh
+
+    def append(self, appliance):
+        """
+        Add an appliance dictionary to the end of the table.
+
+        Parameters:
+        - appliance (dict): The appliance to add.
+        """
+        self._watts.append(float(appliance["watts"]))
+        self._hours.append(float(appliance["hours_per_day"]))
+        self.names.append(appliance["name"])
+        self._monthly_kwh = None
+
+    def pop(self, index):
+        """
+        Remove an appliance, keeping the order of the remaining ones.
+
+        Parameters:
+        - index (int): The position of the appliance to remove.
+
+        Returns:
+        - dict: The removed appliance.
+        """
+        appliance = self[index]
+        del self._watts[index]
+        del self._hours[index]
+        del self.names[index]
+        self._monthly_kwh = None
+        return appliance
+
+    def set_name(self, index, name):
+        """Rename the appliance at the given position."""
+        self.names[index] = name
+
+    def set_watts(self, index, watts):
+        """Update the power consumption (in watts) of the appliance at the given position."""
+        self._watts[index] = float(watts)
+        self._monthly_kwh = None
+
+    def set_hours(self, index, hours_per_day):
+        """Update the daily hours of use of the appliance at the given position."""
+        self._hours[index] = float(hours_per_day)
+        self._monthly_kwh = None
+
 def calculate_daily_kwh(watts, hours_per_day):
     """
     Calculate the daily energy consumption in kWh.
@@ -119,22 +343,174 @@ def calculate_cost(kwh, price_per_kwh):
     """
     return kwh * price_per_kwh
 
+# ----- BULK CALCULATION KERNELS (NumPy arrays) -----
+# The kernels are written as NumPy array expressions. With Numba installed they
+# are compiled at import time (the explicit signatures) and cached on disk
+# (cache=True); without it they run as ordinary NumPy code.
+
+@njit("void(f8[:], f8[:], f8[:])", cache=True)
+def _compute_monthly_kwh(watts, hours, out):
+    """
+    Write the monthly kWh of every appliance, from the watts and hours columns, into out.
+
+    Mirrors calculate_monthly_kwh(calculate_daily_kwh(...)) step by step so the
+    results round exactly like the scalar helpers.
+    """
+    np.multiply(watts, hours, out)
+    np.divide(out, 1000.0, out)
+    np.multiply(out, 30.0, out)
+
+@njit("UniTuple(f8, 2)(f8[:], f8, f8[:])", cache=True)
+def _compute_costs(monthly_kwh, price_per_kwh, out):
+    """
+    Write the cost of every appliance into out and return (total kWh, total cost).
+    """
+    np.multiply(monthly_kwh, price_per_kwh, out)
+    return monthly_kwh.sum(), out.sum()
+
+@njit("UniTuple(f8, 2)(f8[:], f8[:], f8, f8[:], f8[:])", cache=True)
+def _compute_totals(watts, hours, price_per_kwh, monthly_out, costs_out):
+    """
+    Write per-appliance monthly kWh and cost into the out arrays and return (total kWh, total cost).
+    """
+    _compute_monthly_kwh(watts, hours, monthly_out)
+    return _compute_costs(monthly_out, price_per_kwh, costs_out)
+
+# Result buffers reused across calculate_totals() calls (e.g. repeated what-if
+# pricing), so reports don't allocate new arrays each time. Only safe because
+# the app is single-threaded and results are copied out with tolist().
+_scratch = {"monthly": None, "cost": None}
+
+def _get_buf(name, count):
+    """
+    Return a float64 scratch buffer of the given length, growing it geometrically when needed.
+    """
+    buf = _scratch[name]
+    if buf is None or buf.size < count:
+        size = count if buf is None else max(count, 2 * buf.size)
+        buf = np.empty(size, dtype=np.float64)
+        _scratch[name] = buf
+    return buf[:count]
+
+def calculate_totals(appliances, price_per_kwh):
+    """
+    Calculate the monthly usage and cost of every appliance in bulk.
+
+    When NumPy is available the watts and hours columns are packed into
+    float64 arrays and handed to the bulk calculation kernels (compiled when
+    Numba is installed as well). The appliances are consumed in a single
+    pass, so a generator such as iter_appliances_from_csv() can be passed
+    directly.
+
+    Parameters:
+    - appliances (AppliancesTable or iterable): The appliance table, or any
+      iterable of appliance dictionaries.
+    - price_per_kwh (float): The price per kWh.
+
+    Returns:
+    - tuple: (monthly_kwh, costs, total_monthly_kwh, total_cost), where
+      monthly_kwh and costs are lists with one entry per appliance.
+    """
+    if isinstance(appliances, AppliancesTable):
+        # Usage only changes when the table is edited, so only the price scaling runs per call
+        monthly_kwh = appliances.monthly_kwh()
+        if np is not None:
+            costs = _get_buf("cost", len(monthly_kwh))
+            total_kwh, total_cost = _compute_costs(monthly_kwh, float(price_per_kwh), costs)
+            return monthly_kwh.tolist(), costs.tolist(), float(total_kwh), float(total_cost)
+        costs = [kwh * price_per_kwh for kwh in monthly_kwh]
+        return list(monthly_kwh), costs, sum(monthly_kwh), sum(costs)
+
+    if np is not None:
+        # Interleave (watts, hours) pairs so both columns come from one pass
+        pairs = np.fromiter(
+            chain.from_iterable((app["watts"], app["hours_per_day"]) for app in appliances),
+            dtype=np.float64
+        ).reshape(-1, 2)
+        watts = pairs[:, 0]
+        hours = pairs[:, 1]
+        monthly_kwh = _get_buf("monthly", len(watts))
+        costs = _get_buf("cost", len(watts))
+        total_kwh, total_cost = _compute_totals(watts, hours, float(price_per_kwh), monthly_kwh, costs)
+        return monthly_kwh.tolist(), costs.tolist(), float(total_kwh), float(total_cost)
+
+    # The calculate_* helpers are inlined here (same operation order) to skip three function calls per appliance
+    monthly_kwh = [app["watts"] * app["hours_per_day"] / 1000.0 * 30.0 for app in appliances]
+    costs = [kwh * price_per_kwh for kwh in monthly_kwh]
+    return monthly_kwh, costs, sum(monthly_kwh), sum(costs)
+
 # ----- DATA PERSISTENCE FUNCTIONS (CSV) -----
 
+# Buffer size for CSV files; large buffers mean fewer read/write syscalls
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB
+# Rows formatted per write() when saving, and the characters that force csv quoting
+CSV_WRITE_CHUNK = 4096
+_CSV_UNSAFE_CHARS = frozenset(',"\r\n')
+
 def save_appliances_to_csv(appliances, filename="appliances.csv"):
     """
     Save the list of appliances to a CSV file.
 
     Parameters:
-    - appliances (list): A list of appliance dictionaries.
+    - appliances (AppliancesTable or list): The appliance table, or a list of appliance dictionaries.
     - filename (str): The filename to save the data.
     """
-    with open(filename, mode="w", newline="") as csv_file:
-        fieldnames = ["name", "watts", "hours_per_day"]
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-        for appliance in appliances:
-            writer.writerow(appliance)
+    if isinstance(appliances, AppliancesTable):
+        rows = appliances.rows()
+    else:
+        rows = ((app["name"], app["watts"], app["hours_per_day"]) for app in appliances)
+
+    with open(filename, mode="w", newline="", buffering=CSV_BUFFER_SIZE) as csv_file:
+        writer = csv.writer(csv_file)
+        terminator = writer.dialect.lineterminator
+        csv_file.write("name,watts,hours_per_day" + terminator)
+        while True:
+            chunk = list(islice(rows, CSV_WRITE_CHUNK))
+            if not chunk:
+                break
+            if all(map(_CSV_UNSAFE_CHARS.isdisjoint, map(itemgetter(0), chunk))):
+                # No name needs quoting, so the rows can be formatted directly
+                csv_file.write("".join([f"{name},{watts},{hours}{terminator}" for name, watts, hours in chunk]))
+            else:
+                writer.writerows(chunk)
+
+def _iter_csv_rows(filename):
+    """
+    Lazily read (name, watts, hours_per_day) tuples from a CSV file.
+
+    Parameters:
+    - filename (str): The filename to load the data from.
+
+    Yields:
+    - tuple: The name and the two numeric fields, converted to float, of each row.
+    """
+    try:
+        with open(filename, mode="r", newline="", buffering=CSV_BUFFER_SIZE) as csv_file:
+            reader = csv.reader(csv_file)
+            # Skip the header row; columns are name, watts, hours_per_day
+            next(reader, None)
+            for row in reader:
+                if not row:
+                    # Blank lines carry no appliance data
+                    continue
+                # Direct float() calls; map(float, ...) was measured slower
+                yield row[0], float(row[1]), float(row[2])
+    except FileNotFoundError:
+        # If the file does not exist, there is nothing to yield
+        return
+
+def iter_appliances_from_csv(filename="appliances.csv"):
+    """
+    Lazily read appliances from a CSV file, one row at a time.
+
+    Parameters:
+    - filename (str): The filename to load the data from.
+
+    Yields:
+    - dict: An appliance dictionary for each row in the file.
+    """
+    for name, watts, hours_per_day in _iter_csv_rows(filename):
+        yield {"name": name, "watts": watts, "hours_per_day": hours_per_day}
 
 def load_appliances_from_csv(filename="appliances.csv"):
     """
@@ -144,41 +520,234 @@ def load_appliances_from_csv(filename="appliances.csv"):
     - filename (str): The filename to load the data from.
 
     Returns:
-    - list: A list of appliance dictionaries.
+    - list: A list of appliance dictionaries (empty if the file does not exist).
+    """
+    return list(iter_appliances_from_csv(filename))
+
+# ----- DATA PERSISTENCE FUNCTIONS (BINARY SIDECAR) -----
+
+# The binary sidecar sits next to the CSV file (e.g. appliances.csv.bin). It
+# starts with a header (magic, record count, and the size and mtime of the CSV
+# file it was written alongside), followed by one fixed-width record per
+# appliance: the UTF-8 name padded to BINARY_NAME_SIZE bytes, then watts and
+# hours per day as little-endian doubles. The CSV file remains the canonical,
+# human-readable copy; the sidecar is only trusted while the header matches it.
+BINARY_SUFFIX = ".bin"
+BINARY_NAME_SIZE = 64
+_BINARY_MAGIC = b"ETAB0001"
+_BINARY_HEADER = struct.Struct("<8sQQq")  # magic, record count, CSV size, CSV mtime_ns
+_BINARY_RECORD = struct.Struct(f"<{BINARY_NAME_SIZE}sdd")
+if np is not None:
+    _BINARY_DTYPE = np.dtype([("name", f"S{BINARY_NAME_SIZE}"), ("watts", "<f8"), ("hours", "<f8")])
+
+def save_appliances_to_binary(appliances, filename="appliances.csv" + BINARY_SUFFIX, source_stat=None):
+    """
+    Save the list of appliances as fixed-width binary records.
+
+    The file is written to a temporary name and moved into place, so an
+    interrupted save never leaves a truncated sidecar behind.
+
+    Parameters:
+    - appliances (AppliancesTable or list): The appliance table, or a list of appliance dictionaries.
+    - filename (str): The filename to save the data.
+    - source_stat (os.stat_result, optional): Stat of the CSV file the sidecar mirrors;
+      recorded in the header so load_appliances() can tell whether the CSV changed since.
+
+    Raises:
+    - ValueError: If an appliance name cannot be stored in a record. Nothing is written in that case.
+    - OSError: If the file cannot be written. Any partial temporary file is removed.
     """
-    appliances = []
+    if isinstance(appliances, AppliancesTable):
+        rows = appliances.rows()
+    else:
+        rows = ((app["name"], app["watts"], app["hours_per_day"]) for app in appliances)
+
+    records = []
+    for name, watts, hours_per_day in rows:
+        encoded = name.encode("utf-8")
+        # Longer names would be truncated and NUL bytes are used as padding
+        if len(encoded) > BINARY_NAME_SIZE or b"\0" in encoded:
+            raise ValueError(f"Appliance name cannot be stored in the binary format: {name!r}")
+        records.append(_BINARY_RECORD.pack(encoded, watts, hours_per_day))
+
+    if source_stat is None:
+        source_size, source_mtime_ns = 0, 0
+    else:
+        source_size, source_mtime_ns = source_stat.st_size, source_stat.st_mtime_ns
+    header = _BINARY_HEADER.pack(_BINARY_MAGIC, len(records), source_size, source_mtime_ns)
+
+    temp_filename = filename + ".tmp"
     try:
-        with open(filename, mode="r", newline="") as csv_file:
-            reader = csv.DictReader(csv_file)
-            for row in reader:
-                # Convert numeric fields from strings to float
-                row["watts"] = float(row["watts"])
-                row["hours_per_day"] = float(row["hours_per_day"])
-                appliances.append(row)
-    except FileNotFoundError:
-        # If the file does not exist, return an empty list
+        with open(temp_filename, mode="wb") as bin_file:
+            bin_file.write(header)
+            bin_file.write(b"".join(records))
+        os.replace(temp_filename, filename)
+    except BaseException:
+        # Also covers Ctrl-C mid-write: never leave the partial file around
+        try:
+            os.remove(temp_filename)
+        except OSError:
+            pass
+        raise
+
+def load_appliances_from_binary(filename="appliances.csv" + BINARY_SUFFIX, source_stat=None):
+    """
+    Load the appliance table from a binary file written by save_appliances_to_binary().
+
+    With NumPy available the file is memory-mapped as a structured array and
+    its columns are copied straight into the table, skipping all text parsing.
+
+    Parameters:
+    - filename (str): The filename to load the data from.
+    - source_stat (os.stat_result, optional): Stat of the CSV file; when given, the
+      file is rejected unless its header records exactly this CSV size and mtime.
+
+    Returns:
+    - AppliancesTable: The loaded appliances.
+
+    Raises:
+    - FileNotFoundError: If the file does not exist.
+    - ValueError: If the header is missing, does not match the file size or the
+      CSV file, or a name is not valid UTF-8.
+    """
+    with open(filename, mode="rb") as bin_file:
+        header = bin_file.read(_BINARY_HEADER.size)
+        if len(header) != _BINARY_HEADER.size:
+            raise ValueError(f"{filename} is not a valid appliance binary file")
+        magic, count, source_size, source_mtime_ns = _BINARY_HEADER.unpack(header)
+        size = os.fstat(bin_file.fileno()).st_size
+        if magic != _BINARY_MAGIC or size != _BINARY_HEADER.size + count * _BINARY_RECORD.size:
+            raise ValueError(f"{filename} is not a valid appliance binary file")
+        if source_stat is not None and (source_size, source_mtime_ns) != (source_stat.st_size, source_stat.st_mtime_ns):
+            raise ValueError(f"{filename} does not match the current CSV file")
+        if count == 0:
+            # np.memmap cannot map an empty region
+            return AppliancesTable()
+        if np is None:
+            data = bin_file.read()
+
+    if np is not None:
+        records = np.memmap(filename, dtype=_BINARY_DTYPE, mode="r", offset=_BINARY_HEADER.size, shape=(count,))
+        names = [name.decode("utf-8") for name in records["name"].tolist()]
+        return AppliancesTable.from_columns(names, records["watts"], records["hours"])
+
+    names, watts, hours = [], [], []
+    for name, appliance_watts, appliance_hours in _BINARY_RECORD.iter_unpack(data):
+        names.append(name.rstrip(b"\0").decode("utf-8"))
+        watts.append(appliance_watts)
+        hours.append(appliance_hours)
+    return AppliancesTable.from_columns(names, watts, hours)
+
+# ----- DATA PERSISTENCE FUNCTIONS (CSV + SIDECAR) -----
+
+def save_appliances(appliances, filename="appliances.csv"):
+    """
+    Save the appliances to the CSV file and refresh its binary sidecar.
+
+    Errors writing the CSV file are raised; the sidecar is best effort and
+    is removed instead if it cannot be written.
+
+    Parameters:
+    - appliances (AppliancesTable or list): The appliance table, or a list of appliance dictionaries.
+    - filename (str): The CSV filename; the sidecar is filename + BINARY_SUFFIX.
+    """
+    save_appliances_to_csv(appliances, filename)
+    sidecar = filename + BINARY_SUFFIX
+    try:
+        save_appliances_to_binary(appliances, sidecar, source_stat=os.stat(filename))
+    except (OSError, ValueError):
+        # The sidecar is only a cache: if a name doesn't fit a record or the write
+        # fails, drop any old sidecar so the CSV is read next time
+        try:
+            os.remove(sidecar)
+        except OSError:
+            pass
+
+def load_appliances(filename="appliances.csv"):
+    """
+    Load the appliance table, using the binary sidecar when it is up to date.
+
+    The sidecar is only used when its header records the current size and
+    mtime of the CSV file, so hand edits to the CSV are always picked up. If
+    it is missing, stale or unreadable, the CSV file is parsed instead.
+
+    Parameters:
+    - filename (str): The CSV filename; the sidecar is filename + BINARY_SUFFIX.
+
+    Returns:
+    - AppliancesTable: The loaded appliances (empty if neither file exists).
+    """
+    try:
+        return load_appliances_from_binary(filename + BINARY_SUFFIX, source_stat=os.stat(filename))
+    except (OSError, ValueError):
         pass
-    return appliances
+    # Rows go straight into the table columns, without an intermediate dict each
+    return AppliancesTable.from_rows(_iter_csv_rows(filename))
 
 
 # ===========================
 # USER INTERFACE FUNCTIONS
 # ===========================
 
-def show_menu():
+# Static screen text is assembled once at import so each redraw is a single write
+_MENU_STR = (
+    "\n===== 🔌 ENERGY SPENT TRACKER =====\n"
+    "1. Add an appliance\n"
+    "2. Calculate usage and cost of a single appliance\n"
+    "3. Calculate total usage and cost of all appliances\n"
+    "4. Edit appliance list\n"
+    "5. View all appliances\n"
+    "0. Exit\n"
+)
+_VIEW_HEADER_STR = "\n📋 Registered Appliances:\n"
+_EDIT_HEADER_STR = "\n🔧 Edit Appliances:\n"
+# Replies accepted as-is for the delete confirmation
+_CONFIRM_YES = frozenset(("y", "Y"))
+# Bound format_map of the edit submenu; call it with the selected appliance dict
+_EDIT_SUBMENU_TPL = (
+    "\nSelected appliance: {name}\n"
+    "1. Edit name\n"
+    "2. Edit watts\n"
+    "3. Edit hours per day\n"
+    "4. Delete appliance\n"
+    "0. Go back to appliance list\n"
+).format_map
+# Bound format_map of one appliance's block in the totals report (option 3)
+_USAGE_ROW_TPL = (
+    "🔹 {name}\n"
+    "   ➤ Monthly kWh: {mk:.2f} kWh\n"
+    "   ➤ Monthly hours used: {mh:.1f} h\n"
+    "   ➤ Estimated monthly cost: ${c:.2f}\n"
+    "\n"
+).format_map
+
+def _write_appliance_list(appliances, separator):
+    """
+    Write the numbered appliance list, one "name | watts | hours" line per appliance.
+
+    Parameters:
+    - appliances (AppliancesTable): The appliance table.
+    - separator (str): The column separator ("|" or "||").
+    """
+    # Render the whole list first and write it out in one go
+    lines = [f"{i}. {name} {separator} {watts}W {separator} {hours}h/day"
+             for i, (name, watts, hours) in enumerate(appliances.rows(), 1)]
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+
+def show_menu(redraw=True):
     """
     Display the main menu and return the user's chosen option.
 
+    Parameters:
+    - redraw (bool, optional): Whether to print the menu before prompting.
+      Pass False when the menu is still on screen (e.g. after an invalid option).
+
     Returns:
     - str: The user's input corresponding to the menu option.
     """
-    print("\n===== 🔌 ENERGY SPENT TRACKER =====")
-    print("1. Add an appliance")
-    print("2. Calculate usage and cost of a single appliance")
-    print("3. Calculate total usage and cost of all appliances")
-    print("4. Edit appliance list")
-    print("5. View all appliances")
-    print("0. Exit")
+    if redraw:
+        sys.stdout.write(_MENU_STR)
     return input("Choose an option: ")
 
 def edit_appliance(appliances):
@@ -186,16 +755,15 @@ def edit_appliance(appliances):
     Allow the user to edit the attributes of an existing appliance or delete it.
 
     Parameters:
-    - appliances (list): The list of appliance dictionaries.
+    - appliances (AppliancesTable): The appliance table.
     """
     if not appliances:
         print("⚠️ No appliances to edit.")
         return
 
     while True:
-        print("\n🔧 Edit Appliances:")
-        for i, app in enumerate(appliances):
-            print(f"{i + 1}. {app['name']} | {app['watts']}W | {app['hours_per_day']}h/day")
+        sys.stdout.write(_EDIT_HEADER_STR)
+        _write_appliance_list(appliances, "|")
         
         # Validate selection input
         choice = get_int("Select the appliance number to edit, or 0 to go back to the main menu: ", 0)
@@ -207,33 +775,32 @@ def edit_appliance(appliances):
 
         if 0 <= choice < len(appliances):
             app = appliances[choice]
-            print(f"\nSelected appliance: {app['name']}")
-            print("1. Edit name")
-            print("2. Edit watts")
-            print("3. Edit hours per day")
-            print("4. Delete appliance")
-            print("0. Go back to appliance list")
+            sys.stdout.write(_EDIT_SUBMENU_TPL(app))
 
-            sub_option = input("Choose an option: ").strip()
+            sub_option = input("Choose an option: ")
+            if len(sub_option) != 1:
+                # A single keypress needs no cleanup; only strip anything longer
+                sub_option = sub_option.strip()
 
             if sub_option == '1':
                 new_name = input(f"Enter new name (current: {app['name']}): ").strip()
                 if new_name:
-                    appliances[choice]['name'] = new_name
+                    appliances.set_name(choice, new_name)
                     print("✅ Name updated successfully!")
                 else:
                     print("❌ Name cannot be empty.")
             elif sub_option == '2':
                 new_watts = get_positive_float(f"Enter new watts (current: {app['watts']}W): ")
-                appliances[choice]['watts'] = new_watts
+                appliances.set_watts(choice, new_watts)
                 print("✅ Watts updated successfully!")
             elif sub_option == '3':
                 new_hours = get_positive_float(f"Enter new hours per day (current: {app['hours_per_day']}h): ")
-                appliances[choice]['hours_per_day'] = new_hours
+                appliances.set_hours(choice, new_hours)
                 print("✅ Hours updated successfully!")
             elif sub_option == '4':
-                confirm = input(f"Are you sure you want to delete '{app['name']}'? (y/n): ").strip().lower()
-                if confirm == 'y':
+                confirm = input(f"Are you sure you want to delete '{app['name']}'? (y/n): ")
+                # Exact "y"/"Y" skips the strip/lower normalization
+                if confirm in _CONFIRM_YES or confirm.strip().lower() == 'y':
                     appliances.pop(choice)
                     print("🗑️ Appliance deleted successfully!")
                 else:
@@ -251,26 +818,28 @@ def view_appliances(appliances):
     Display a formatted list of all appliances.
 
     Parameters:
-    - appliances (list): The list of appliance dictionaries.
+    - appliances (AppliancesTable): The appliance table.
     """
     if not appliances:
         print("⚠️ No appliances added yet.")
         return
 
-    print("\n📋 Registered Appliances:")
-    for i, app in enumerate(appliances):
-        print(f"{i + 1}. {app['name']} || {app['watts']}W || {app['hours_per_day']}h/day")
+    sys.stdout.write(_VIEW_HEADER_STR)
+    _write_appliance_list(appliances, "||")
 
 def main():
     """
     The main entry point of the Energy Spent Tracker application.
     Handles the flow of user interaction.
     """
-    # Load appliances from CSV file at startup
-    appliances = load_appliances_from_csv()
+    # Load appliances at startup (from the binary sidecar when it is up to date)
+    appliances = load_appliances()
+    # True while the menu printed last is still right above the prompt
+    menu_shown = False
 
     while True:
-        option = show_menu().strip()
+        option = show_menu(redraw=not menu_shown).strip()
+        menu_shown = False
 
         if option == '1':
             # Adding a new appliance
@@ -290,8 +859,8 @@ def main():
                 print("⚠️ No appliances added yet.")
                 continue
 
-            for i, app in enumerate(appliances):
-                print(f"{i + 1}. {app['name']}")
+            for i, name in enumerate(appliances.names):
+                print(f"{i + 1}. {name}")
 
             choice = get_int("Select appliance number: ", 1, len(appliances)) - 1
 
@@ -315,23 +884,13 @@ def main():
 
             price_per_kwh = get_positive_float("Enter price per kWh (e.g. 0.5): ")
 
-            total_monthly_kwh = 0
-            total_cost = 0
+            monthly_kwh, costs, total_monthly_kwh, total_cost = calculate_totals(appliances, price_per_kwh)
 
             print("\n📊 INDIVIDUAL APPLIANCE USAGE:")
-            for app in appliances:
-                daily_kwh = calculate_daily_kwh(app['watts'], app['hours_per_day'])
-                monthly_kwh = calculate_monthly_kwh(daily_kwh)
-                monthly_hours = app['hours_per_day'] * 30
-                cost = calculate_cost(monthly_kwh, price_per_kwh)
-
-                total_monthly_kwh += monthly_kwh
-                total_cost += cost
-
-                print(f"🔹 {app['name']}")
-                print(f"   ➤ Monthly kWh: {monthly_kwh:.2f} kWh")
-                print(f"   ➤ Monthly hours used: {monthly_hours:.1f} h")
-                print(f"   ➤ Estimated monthly cost: ${cost:.2f}\n")
+            # Format every appliance block first and write the report in one go
+            rows = [_USAGE_ROW_TPL({"name": name, "mk": kwh, "mh": hours_per_day * 30, "c": cost})
+                    for (name, _, hours_per_day), kwh, cost in zip(appliances.rows(), monthly_kwh, costs)]
+            sys.stdout.write("".join(rows))
 
             print("📈 TOTAL ENERGY USAGE & COST")
             print(f"   ➤ Total monthly usage: {total_monthly_kwh:.2f} kWh")
@@ -351,9 +910,11 @@ def main():
 
         else:
             print("❌ Invalid option. Try again.")
+            # The menu is still directly above this error message, so just prompt again
+            menu_shown = True
 
-    # Save appliances to CSV file on exit
-    save_appliances_to_csv(appliances)
+    # Save appliances to the CSV file (and its binary sidecar) on exit
+    save_appliances(appliances)
     print("Data saved to appliances.csv.")
 
 if __name__ == "__main__":
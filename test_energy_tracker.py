@@ -2,13 +2,21 @@ import pytest
 import os
 from energy_tracker import (
     add_appliance,
+    AppliancesTable,
     calculate_daily_kwh,
     calculate_monthly_kwh,
     calculate_cost,
+    calculate_totals,
     save_appliances_to_csv,
     load_appliances_from_csv,
+    iter_appliances_from_csv,
+    save_appliances_to_binary,
+    load_appliances_from_binary,
+    save_appliances,
+    load_appliances,
     get_positive_float,
-    get_int
+    get_int,
+    show_menu
 )
 
 # ---------------------------
@@ -37,6 +45,79 @@ def test_calculate_cost():
     cost = calculate_cost(6, 0.5)
     assert cost == pytest.approx(3.0)
 
+def test_calculate_totals():
+    # Lamp: 60W * 5h -> 9 kWh/month, TV: 120W * 4h -> 14.4 kWh/month; at 0.5 per kWh
+    appliances = [
+        {"name": "Lamp", "watts": 60, "hours_per_day": 5},
+        {"name": "TV", "watts": 120, "hours_per_day": 4}
+    ]
+    monthly_kwh, costs, total_kwh, total_cost = calculate_totals(appliances, 0.5)
+    assert monthly_kwh == pytest.approx([9.0, 14.4])
+    assert costs == pytest.approx([4.5, 7.2])
+    assert total_kwh == pytest.approx(23.4)
+    assert total_cost == pytest.approx(11.7)
+
+    # A second report at another price must not change the results of the first
+    calculate_totals(appliances, 2.0)
+    assert costs == pytest.approx([4.5, 7.2])
+
+    # Must round exactly like the scalar helpers (5W * 6.5h shows 0.98 in both options 2 and 3)
+    for appliances in ([{"name": "Charger", "watts": 5, "hours_per_day": 6.5}],
+                       AppliancesTable([{"name": "Charger", "watts": 5, "hours_per_day": 6.5}])):
+        monthly_kwh, _, _, _ = calculate_totals(appliances, 1.0)
+        assert monthly_kwh[0] == calculate_monthly_kwh(calculate_daily_kwh(5, 6.5))
+
+
+def test_appliances_table():
+    # Rows are appended one by one, so the numeric columns grow as they are filled
+    table = AppliancesTable(add_appliance(f"App {i}", 100 + i, 2) for i in range(20))
+    assert len(table) == 20
+    assert table[0] == {"name": "App 0", "watts": 100.0, "hours_per_day": 2.0}
+    assert table[-1]["watts"] == pytest.approx(119)
+
+    # Removing a row keeps the remaining appliances in order
+    removed = table.pop(1)
+    assert removed["name"] == "App 1"
+    assert [app["name"] for app in table][:3] == ["App 0", "App 2", "App 3"]
+
+    table.set_name(0, "Heater")
+    table.set_watts(0, 2000)
+    table.set_hours(0, 3)
+    assert table[0] == {"name": "Heater", "watts": 2000.0, "hours_per_day": 3.0}
+
+    # Building from plain rows gives the same table as building from dicts
+    assert list(AppliancesTable.from_rows(table.rows())) == list(table)
+
+    # Totals from the columns match totals from the equivalent list of dicts
+    monthly_kwh, costs, total_kwh, total_cost = calculate_totals(table, 0.5)
+    expected = calculate_totals(list(table), 0.5)
+    assert monthly_kwh == pytest.approx(expected[0])
+    assert costs == pytest.approx(expected[1])
+    assert total_kwh == pytest.approx(expected[2])
+    assert total_cost == pytest.approx(expected[3])
+
+
+def test_appliances_table_monthly_kwh_cache():
+    table = AppliancesTable([add_appliance("Lamp", 60, 5), add_appliance("TV", 120, 4)])
+    monthly_kwh = table.monthly_kwh()
+    assert list(monthly_kwh) == pytest.approx([9.0, 14.4])
+    # Unchanged data reuses the cached column
+    assert table.monthly_kwh() is monthly_kwh
+
+    # Renaming leaves usage alone; changing watts or hours recomputes it
+    table.set_name(0, "Desk Lamp")
+    assert table.monthly_kwh() is monthly_kwh
+    table.set_watts(0, 100)
+    assert list(table.monthly_kwh()) == pytest.approx([15.0, 14.4])
+    table.set_hours(1, 2)
+    assert list(table.monthly_kwh()) == pytest.approx([15.0, 7.2])
+
+    # Holding a column must not block resizing the table
+    watts = table.watts
+    table.append(add_appliance("Fan", 50, 8))
+    table.pop(2)
+    assert list(watts) == [100.0, 120.0]
+
 
 # ---------------------------
 # CSV Persistence Tests
@@ -64,6 +145,107 @@ def test_csv_persistence(tmp_path):
         assert loaded[i]["watts"] == pytest.approx(appliances[i]["watts"])
         assert loaded[i]["hours_per_day"] == pytest.approx(appliances[i]["hours_per_day"])
 
+def test_csv_persistence_quoted_names(tmp_path):
+    test_file = tmp_path / "test_appliances.csv"
+    # Names with the csv delimiter or quote character must survive the round trip
+    appliances = [
+        {"name": "Lamp", "watts": 60, "hours_per_day": 5},
+        {"name": 'Fridge, "big"', "watts": 150, "hours_per_day": 24}
+    ]
+    save_appliances_to_csv(appliances, filename=str(test_file))
+    assert test_file.read_bytes().startswith(b"name,watts,hours_per_day\r\nLamp,60,5\r\n")
+    assert [app["name"] for app in load_appliances_from_csv(filename=str(test_file))] == ["Lamp", 'Fridge, "big"']
+
+def test_iter_appliances_from_csv(tmp_path):
+    test_file = tmp_path / "test_appliances.csv"
+    save_appliances_to_csv(
+        [{"name": "Lamp", "watts": 60, "hours_per_day": 5}],
+        filename=str(test_file)
+    )
+
+    # The generator can feed the totals calculation without building a list first
+    _, _, total_kwh, total_cost = calculate_totals(iter_appliances_from_csv(str(test_file)), 0.5)
+    assert total_kwh == pytest.approx(9.0)
+    assert total_cost == pytest.approx(4.5)
+
+    # A missing file yields nothing instead of raising
+    assert list(iter_appliances_from_csv(str(tmp_path / "missing.csv"))) == []
+
+def test_binary_persistence(tmp_path):
+    test_file = str(tmp_path / "test_appliances.csv.bin")
+    appliances = [
+        {"name": "Lâmpada", "watts": 60, "hours_per_day": 5},
+        {"name": "TV", "watts": 120, "hours_per_day": 4.5}
+    ]
+
+    save_appliances_to_binary(appliances, filename=test_file)
+    loaded = load_appliances_from_binary(filename=test_file)
+    assert list(loaded) == [
+        {"name": "Lâmpada", "watts": 60.0, "hours_per_day": 5.0},
+        {"name": "TV", "watts": 120.0, "hours_per_day": 4.5}
+    ]
+
+    # Names that would be truncated are rejected rather than silently cut short
+    with pytest.raises(ValueError):
+        save_appliances_to_binary([{"name": "X" * 65, "watts": 1, "hours_per_day": 1}], filename=test_file)
+
+def test_load_appliances_uses_fresh_sidecar_only(tmp_path):
+    csv_file = str(tmp_path / "test_appliances.csv")
+    save_appliances([{"name": "Lamp", "watts": 60, "hours_per_day": 5}], filename=csv_file)
+    assert os.path.exists(csv_file + ".bin")
+    assert [app["name"] for app in load_appliances(filename=csv_file)] == ["Lamp"]
+
+    # A CSV newer than the sidecar (e.g. edited by hand) wins
+    save_appliances_to_csv([{"name": "TV", "watts": 120, "hours_per_day": 4}], filename=csv_file)
+    sidecar_mtime = os.stat(csv_file + ".bin").st_mtime
+    os.utime(csv_file, (sidecar_mtime + 10, sidecar_mtime + 10))
+    assert [app["name"] for app in load_appliances(filename=csv_file)] == ["TV"]
+
+    # A hand edit within the same mtime tick is still detected (the sidecar records the CSV size)
+    save_appliances([{"name": "Lamp", "watts": 60, "hours_per_day": 5}], filename=csv_file)
+    saved = os.stat(csv_file)
+    save_appliances_to_csv([{"name": "Fridge", "watts": 150, "hours_per_day": 24}], filename=csv_file)
+    os.utime(csv_file, ns=(saved.st_atime_ns, saved.st_mtime_ns))
+    assert [app["name"] for app in load_appliances(filename=csv_file)] == ["Fridge"]
+
+    # When a name does not fit the binary format, the stale sidecar is removed
+    save_appliances([{"name": "X" * 65, "watts": 1, "hours_per_day": 1}], filename=csv_file)
+    assert not os.path.exists(csv_file + ".bin")
+    assert [app["name"] for app in load_appliances(filename=csv_file)] == ["X" * 65]
+
+
+def test_load_appliances_ignores_damaged_sidecar(tmp_path):
+    csv_file = str(tmp_path / "test_appliances.csv")
+    sidecar = csv_file + ".bin"
+    appliances = [{"name": name, "watts": 100, "hours_per_day": 1} for name in "ABC"]
+    save_appliances(appliances, filename=csv_file)
+    with open(sidecar, "rb") as bin_file:
+        data = bin_file.read()
+
+    # The same file for two appliances is exactly one record shorter
+    save_appliances_to_binary(appliances[:2], filename=str(tmp_path / "two.bin"))
+    record_size = len(data) - os.path.getsize(tmp_path / "two.bin")
+
+    # Truncated at a record boundary, cut inside the header, or empty: the CSV is used
+    for damaged in (data[:-record_size], data[:10], b""):
+        with open(sidecar, "wb") as bin_file:
+            bin_file.write(damaged)
+        with pytest.raises(ValueError):
+            load_appliances_from_binary(filename=sidecar)
+        assert [app["name"] for app in load_appliances(filename=csv_file)] == ["A", "B", "C"]
+
+def test_save_appliances_survives_sidecar_write_error(tmp_path, monkeypatch):
+    csv_file = str(tmp_path / "test_appliances.csv")
+    save_appliances([{"name": "Lamp", "watts": 60, "hours_per_day": 5}], filename=csv_file)
+
+    # A failing sidecar write (e.g. disk full) must not break saving the CSV
+    def fail_replace(src, dst):
+        raise OSError("No space left on device")
+    monkeypatch.setattr(os, "replace", fail_replace)
+    save_appliances([{"name": "TV", "watts": 120, "hours_per_day": 4}], filename=csv_file)
+
+    assert sorted(os.listdir(tmp_path)) == ["test_appliances.csv"]
+    assert [app["name"] for app in load_appliances(filename=csv_file)] == ["TV"]
 
 # ---------------------------
 # Input Validation Tests Using Monkeypatch
@@ -84,6 +266,20 @@ def test_get_int(monkeypatch):
     result = get_int("Enter integer: ", 1, 10)
     assert result == 5
 
+def test_get_int_open_bounds(monkeypatch):
+    # Only a lower bound: anything from 0 upwards is accepted
+    inputs = iter(["-1", "1000000"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+    assert get_int("Enter integer: ", 0) == 1000000
+
+def test_show_menu_redraw(monkeypatch, capsys):
+    monkeypatch.setattr("builtins.input", lambda prompt="": "3")
+    assert show_menu() == "3"
+    assert "ENERGY SPENT TRACKER" in capsys.readouterr().out
+    # Without a redraw only the prompt is shown
+    assert show_menu(redraw=False) == "3"
+    assert capsys.readouterr().out == ""
+
 # ---------------------------
 # Main block for running tests directly
 # ---------------------------